@@ -3,13 +3,25 @@
 Chain multiple Sora-2 segments into a longer video with better continuity.
 Uses last frames as starting images, pads the head of each clip with the previous
 last frame, and crossfades using the real segment durations.
+
+Performance note: this pipeline is latency-bound on Sora-2 generation and on
+subprocess round-trips, and I/O-bound in ffmpeg - there is no per-pixel Python
+work. Speedups come from overlapping work with generation, fewer process
+launches, and stream copy over re-encoding; SIMD/GPU-style tuning does not
+apply here.
 """
 
 import argparse
+import contextlib
+import json
 import os
+import shutil
 import subprocess
 import sys
-from typing import Optional
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
@@ -18,58 +30,205 @@ if sys.platform == "win32":
     except Exception:
         pass
 
-
-def run_command(cmd, description):
-    """Run a shell command and handle errors."""
+# Generation and frame extraction run in-process instead of re-launching Python per segment
+try:
+    from extract_last_frame import extract_last_frame
+    from video_generator import generate_video
+except ImportError as e:
+    print(f"? Error: {e}")
+    print("Install dependencies with: pip install -r requirements.txt")
+    sys.exit(1)
+
+# 1 MB pipe buffers: fewer read() syscalls when ffmpeg/ffprobe produce lots of output
+PIPE_BUFFER_SIZE = 1 << 20
+
+# ffprobe metadata keyed by (absolute path, size, mtime_ns); see probe_video()
+_PROBE_CACHE = {}
+
+# libx264 -profile:v names for the H.264 profiles ffprobe reports
+X264_PROFILES = {
+    'Constrained Baseline': 'baseline',
+    'Baseline': 'baseline',
+    'Main': 'main',
+    'High': 'high',
+    'High 10': 'high10',
+    'High 4:2:2': 'high422',
+    'High 4:4:4 Predictive': 'high444',
+}
+
+
+def run_command(cmd, description, input_text=None):
+    """
+    Run a command (argument list, no shell) and handle errors. stdout goes
+    straight to the console; only stderr is captured, for the error report.
+    """
     print(f"\n?? {description}...")
+    # Flush our own output first so it stays ahead of the child's
+    sys.stdout.flush()
 
     # Use UTF-8 encoding for subprocess on Windows
     encoding = 'utf-8' if sys.platform == "win32" else None
-    result = subprocess.run(
+    process = subprocess.Popen(
         cmd,
-        shell=True,
-        capture_output=True,
+        # Never hand the terminal to ffmpeg: parallel instances would fight over it
+        # for interactive keys and can leave the tty in a bad state
+        stdin=subprocess.PIPE if input_text is not None else subprocess.DEVNULL,
+        stdout=None,
+        stderr=subprocess.PIPE,
         text=True,
         encoding=encoding,
-        errors='replace'  # Replace undecodable bytes with '?'
+        errors='replace',  # Replace undecodable bytes with '?'
+        bufsize=PIPE_BUFFER_SIZE,
     )
 
-    if result.returncode != 0:
+    # communicate() feeds stdin and drains stderr together, so neither pipe can stall the child
+    _, stderr = process.communicate(input_text)
+
+    if process.returncode != 0:
         print(f"? Error: {description} failed")
-        print(result.stderr)
+        print(stderr)
+        sys.exit(1)
+
+
+def check_dependencies():
+    """
+    Exit early if ffmpeg or ffprobe is missing. These are path lookups only,
+    nothing is spawned; the Python helpers are checked by the import above.
+    """
+    missing = [tool for tool in ('ffmpeg', 'ffprobe') if shutil.which(tool) is None]
+    if missing:
+        print(f"? Error: {' and '.join(missing)} not found")
+        print("   Install ffmpeg: https://ffmpeg.org/download.html")
         sys.exit(1)
 
-    return result.stdout
 
+def remove_files(paths: List[str]) -> None:
+    """Delete temporary files, skipping any that are already gone."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def remove_files_in_background(paths: List[str]) -> threading.Thread:
+    """
+    Delete temporary files on a worker thread so the summary is not held up by
+    slow unlinks (e.g. antivirus scanning on Windows). The thread is not a
+    daemon, so the interpreter still waits for it before exiting.
+    """
+    cleanup_thread = threading.Thread(target=remove_files, args=(list(paths),), daemon=False)
+    cleanup_thread.start()
+    return cleanup_thread
+
+
+def concat_file_line(path: str) -> str:
+    """Return a concat-demuxer 'file' directive for path."""
+    # The list is read from stdin, so relative paths would resolve against
+    # "pipe:" instead of the working directory; quotes are escaped per the
+    # concat script syntax.
+    escaped = os.path.abspath(path).replace("'", "'\\''")
+    return f"file '{escaped}'"
+
+
+def decodes_cleanly(path: str) -> bool:
+    """Return True if ffmpeg decodes every stream of path without a single error."""
+    check = subprocess.run(
+        ['ffmpeg', '-v', 'error', '-xerror', '-i', path, '-f', 'null', '-'],
+        stdin=subprocess.DEVNULL, capture_output=True, text=True, bufsize=PIPE_BUFFER_SIZE
+    )
+    return check.returncode == 0 and not check.stderr.strip()
+
+
+def concat_with_stream_copy(concat_lines: List[str], output: str, description: str) -> bool:
+    """
+    Join inputs described in concat-demuxer syntax into output without
+    re-encoding. Returns False if the result does not decode cleanly, in which
+    case the caller should re-encode instead.
+    """
+    # Splice through MPEG-TS: the concat demuxer converts each file to Annex B
+    # with that file's own SPS/PPS in-band, whereas an mp4 output would keep only
+    # the first file's decoder config for every spliced clip
+    with tempfile.TemporaryDirectory(prefix='chain_videos_') as work_dir:
+        spliced = os.path.join(work_dir, 'spliced.ts')
+        # Feed the list on stdin rather than writing, reading and deleting a list file.
+        # A larger input packet queue keeps the copy from stalling on bursty reads
+        ffmpeg_cmd = [
+            'ffmpeg', '-thread_queue_size', '1024',
+            '-f', 'concat', '-safe', '0', '-protocol_whitelist', 'file,pipe',
+            '-i', 'pipe:0', '-c', 'copy', '-f', 'mpegts', '-muxdelay', '0', '-muxpreload', '0',
+            spliced, '-y',
+        ]
+        run_command(ffmpeg_cmd, description, input_text="\n".join(concat_lines) + "\n")
+
+        # faststart moves the index to the front so the result plays while loading
+        remux_cmd = [
+            'ffmpeg', '-i', spliced, '-c', 'copy', '-bsf:a', 'aac_adtstoasc',
+            '-movflags', '+faststart', output, '-y',
+        ]
+        run_command(remux_cmd, "Remuxing spliced stream to MP4")
+
+    print("?? Checking that the spliced video decodes cleanly...")
+    return decodes_cleanly(output)
+
+
+def probe_video(path: str) -> Optional[dict]:
+    """
+    Return ffprobe's format, stream and packet metadata for a video, or None if
+    it cannot be read. One ffprobe run serves every metadata lookup (duration,
+    stream parameters and keyframe times); results are cached per (path, size,
+    mtime) so unchanged files are never probed twice.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key in _PROBE_CACHE:
+        return _PROBE_CACHE[key]
 
-def get_video_duration(path: str) -> float:
-    """Return the duration of a video in seconds using ffprobe."""
     probe = subprocess.run(
-        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-         '-of', 'default=noprint_wrappers=1:nokey=1', path],
-        capture_output=True, text=True
+        ['ffprobe', '-v', 'error',
+         '-show_entries',
+         'format=duration'
+         ':stream=index,codec_type,codec_name,profile,level,width,height,'
+         'pix_fmt,r_frame_rate,avg_frame_rate,sample_rate,channels'
+         ':packet=stream_index,pts_time,dts_time,flags',
+         '-of', 'json', path],
+        capture_output=True, text=True, bufsize=PIPE_BUFFER_SIZE
     )
     if probe.returncode != 0:
+        return None
+    try:
+        metadata = json.loads(probe.stdout)
+    except ValueError:
+        return None
+
+    _PROBE_CACHE[key] = metadata
+    return metadata
+
+
+def get_video_duration(path: str) -> float:
+    """Return the duration of a video in seconds using ffprobe."""
+    metadata = probe_video(path)
+    if metadata is None:
         print(f"? Error: Could not read duration for {path}")
         sys.exit(1)
+    duration = metadata.get('format', {}).get('duration')
     try:
-        return float(probe.stdout.strip())
-    except ValueError:
-        print(f"? Error: Invalid duration returned for {path}: {probe.stdout}")
+        return float(duration)
+    except (TypeError, ValueError):
+        print(f"? Error: Invalid duration returned for {path}: {duration}")
         sys.exit(1)
 
 
 def get_video_fps(path: str) -> Optional[float]:
     """Return the average FPS for a video or None if unavailable."""
-    probe = subprocess.run(
-        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
-         '-show_entries', 'stream=avg_frame_rate',
-         '-of', 'default=noprint_wrappers=1:nokey=1', path],
-        capture_output=True, text=True
-    )
-    if probe.returncode != 0:
+    metadata = probe_video(path)
+    if metadata is None:
         return None
-    rate = probe.stdout.strip()
+    video = next((st for st in metadata.get('streams', []) if st.get('codec_type') == 'video'), None)
+    if video is None:
+        return None
+    rate = str(video.get('avg_frame_rate', '')).strip()
     if '/' in rate:
         num, den = rate.split('/')
         try:
@@ -87,55 +246,522 @@ def get_video_fps(path: str) -> Optional[float]:
     return None
 
 
-def pad_segment_with_frame(segment_path: str, frame_path: str,
-                           pad_seconds: float, fps: Optional[float]) -> None:
+def get_video_frame_rate(path: str) -> str:
     """
-    Prepend a short still section (previous segment's last frame) to the start
-    of a segment so the next crossfade blends against identical frames. Unlike a
-    pure freeze, this eases from the last frame into the first motion of the new
-    segment to avoid a visible "static then jump".
+    Return the video's r_frame_rate as ffprobe reports it (e.g. "30000/1001"),
+    or "30" if unavailable. Filters given this exact string produce the same
+    frame rate as the decoded stream, which a rounded float would not.
     """
-    if pad_seconds <= 0:
-        return
+    metadata = probe_video(path) or {}
+    video = next((st for st in metadata.get('streams', []) if st.get('codec_type') == 'video'), None)
+    rate = str((video or {}).get('r_frame_rate', '')).strip()
+    return rate if rate and not rate.endswith('/0') else '30'
 
-    if not os.path.exists(frame_path):
-        print(f"? Warning: pad frame missing ({frame_path}); skipping padding.")
-        return
 
-    # Clamp pad to segment duration to avoid zero-length outputs
-    seg_duration = get_video_duration(segment_path)
-    if pad_seconds >= seg_duration:
-        pad_seconds = max(0, seg_duration - 0.1)
-        print(f"? Pad trimmed to {pad_seconds:.2f}s to fit segment duration")
-    if pad_seconds <= 0:
-        return
+def resolve_pad_durations(segment_files: List[str], segment_durations: List[float],
+                          pad_frames: List[Optional[str]], pad_seconds: float) -> List[float]:
+    """
+    Work out how much still-frame padding each segment gets: none without a
+    previous last frame (the first segment, or if extraction left nothing), none
+    when the pad rounds to less than one frame, and never the whole segment.
+    """
+    pad_durations = []
+    for segment_file, duration, frame in zip(segment_files, segment_durations, pad_frames):
+        pad = pad_seconds if frame else 0
+        if pad > 0 and not os.path.exists(frame):
+            print(f"? Warning: pad frame missing ({frame}); skipping padding.")
+            pad = 0
+
+        # A sub-frame still adds no continuity but would still cost extra inputs
+        # and filters in the combine graph
+        if pad > 0 and round(pad * (get_video_fps(segment_file) or 30)) < 1:
+            print(f"? Pad of {pad}s for {segment_file} is under one frame; skipping padding.")
+            pad = 0
+
+        # Clamp pad to segment duration to avoid zero-length outputs
+        if pad >= duration:
+            pad = max(0, duration - 0.1)
+            print(f"? Pad for {segment_file} trimmed to {pad:.2f}s to fit segment duration")
+        pad_durations.append(pad)
+    return pad_durations
+
+
+def channel_layout_name(channels: int) -> str:
+    """Return an ffmpeg channel layout name for a channel count."""
+    return {1: 'mono', 2: 'stereo'}.get(channels, f"{channels}c")
+
+
+def still_frame_inputs(frame_path: str, pad_seconds: float, sample_rate: int,
+                       channel_layout: str) -> List[str]:
+    """ffmpeg inputs for a looped still of frame_path plus matching silence."""
+    return [
+        '-loop', '1', '-t', f"{pad_seconds:.3f}", '-i', frame_path,
+        '-f', 'lavfi', '-t', f"{pad_seconds:.3f}",
+        '-i', f"anullsrc=r={sample_rate}:cl={channel_layout}",
+    ]
+
+
+def padded_segment_filters(segment_index: int, still_index: int, label: str, frame_rate: str,
+                           pix_fmt: str, sample_rate: int, channel_layout: str) -> List[str]:
+    """
+    Filter chains that prepend a short still section (previous segment's last
+    frame, input still_index, with silence at still_index + 1) to a segment, so
+    the crossfade into it blends against identical frames. Unlike a pure
+    freeze, this eases from the last frame into the first motion of the new
+    segment to avoid a visible "static then jump". Produces [{label}v] and
+    [{label}a]; the video comes out of concat with the AVTB time base, so any
+    stream crossfaded against it needs settb=AVTB as well.
+    """
+    audio_format = f"aformat=sample_rates={sample_rate}:channel_layouts={channel_layout}"
+    return [
+        f"[{still_index}:v]fps={frame_rate},format={pix_fmt},setsar=1,settb=AVTB[{label}sv]",
+        f"[{segment_index}:v]setpts=PTS-STARTPTS,settb=AVTB[{label}mv]",
+        f"[{label}sv][{label}mv]concat=n=2:v=1:a=0[{label}v]",
+        f"[{still_index + 1}:a]{audio_format},asetpts=PTS-STARTPTS[{label}sa]",
+        f"[{segment_index}:a]aresample={sample_rate},{audio_format},asetpts=PTS-STARTPTS[{label}ma]",
+        f"[{label}sa][{label}ma]concat=n=2:v=0:a=1[{label}a]",
+    ]
+
+
+def get_stream_params(path: str) -> Optional[dict]:
+    """Return the stream parameters that must match for stream-copy splicing."""
+    metadata = probe_video(path)
+    if metadata is None:
+        return None
 
-    fps_value = fps if fps else 30
-    padded_path = segment_path.replace('.mp4', '_padded.mp4')
+    streams = metadata.get('streams', [])
+    video = next((st for st in streams if st.get('codec_type') == 'video'), None)
+    audio = next((st for st in streams if st.get('codec_type') == 'audio'), None)
+    if video is None or audio is None:
+        return None
+    return {
+        'video_codec': video.get('codec_name'),
+        'profile': video.get('profile'),
+        'level': video.get('level'),
+        'width': video.get('width'),
+        'height': video.get('height'),
+        'pix_fmt': video.get('pix_fmt'),
+        'frame_rate': video.get('r_frame_rate'),
+        'audio_codec': audio.get('codec_name'),
+        'audio_profile': audio.get('profile'),
+        'sample_rate': audio.get('sample_rate'),
+        'channels': audio.get('channels'),
+    }
+
+
+def get_splice_params(segment_files: List[str]) -> Optional[dict]:
+    """
+    Return the stream parameters shared by all segments if they can be spliced
+    with stream copy next to libx264/AAC transition clips, otherwise None.
+    Profile and level must match too and be ones libx264 can encode to, so
+    the clips never need a decoder configuration the segments don't.
+    The clips are AAC-LC, so the segments' audio must be too.
+    Mixed parameters (or other codecs) need the full re-encode instead.
+    """
+    params = [get_stream_params(seg) for seg in segment_files]
+    first = params[0]
+    if first is None or any(p != first for p in params[1:]):
+        return None
+    if first['video_codec'] != 'h264' or first['audio_codec'] != 'aac' or first['audio_profile'] != 'LC':
+        return None
+    if first['profile'] not in X264_PROFILES or not isinstance(first['level'], int) or first['level'] <= 0:
+        return None
+    return first
 
-    filter_complex = (
-        f"[0:v]fps={fps_value},format=yuv420p,setsar=1[vpad];"
-        f"[1:v]setpts=PTS-STARTPTS[vseg];"
-        f"[1:a]aresample=48000,aformat=sample_rates=48000:channel_layouts=stereo,asetpts=PTS-STARTPTS[aseg];"
-        f"[2:a]aformat=sample_rates=48000:channel_layouts=stereo,asetpts=PTS-STARTPTS[asilence];"
-        f"[vpad][vseg]concat=n=2:v=1:a=0[vout];"
-        f"[asilence][aseg]concat=n=2:v=0:a=1[aout]"
-    )
 
-    cmd = (
-        f'ffmpeg -y -loop 1 -t {pad_seconds} -i "{frame_path}" '
-        f'-i "{segment_path}" -f lavfi -t {pad_seconds} '
-        f'-i anullsrc=r=48000:cl=stereo '
-        f'-filter_complex "{filter_complex}" '
-        f'-map "[vout]" -map "[aout]" -c:v libx264 -crf 18 -preset fast '
-        f'-c:a aac -shortest "{padded_path}"'
-    )
-    run_command(cmd, f"Padding {segment_path} with previous last frame ({pad_seconds}s)")
-    os.replace(padded_path, segment_path)
+def h264_profile_args(splice_params: dict) -> List[str]:
+    """
+    libx264 arguments that encode to the segments' own H.264 profile and level,
+    repeating SPS/PPS at every keyframe so each spliced clip carries its own.
+    """
+    level = splice_params['level']
+    return ['-profile:v', X264_PROFILES[splice_params['profile']],
+            '-level', f"{level // 10}.{level % 10}", '-x264-params', 'repeat-headers=1']
+
+
+def get_keyframes(path: str) -> List[Tuple[float, float]]:
+    """Return (presentation time, decoding time) in seconds of the video keyframes."""
+    metadata = probe_video(path)
+    if metadata is None:
+        return []
+    video = next((st for st in metadata.get('streams', []) if st.get('codec_type') == 'video'), None)
+    if video is None:
+        return []
+    keyframes = []
+    for packet in metadata.get('packets', []):
+        if packet.get('stream_index') != video.get('index') or 'K' not in packet.get('flags', ''):
+            continue
+        try:
+            keyframes.append((float(packet.get('pts_time')), float(packet.get('dts_time'))))
+        except (TypeError, ValueError):
+            continue
+    return sorted(keyframes)
+
+
+def get_keyframe_times(path: str) -> List[float]:
+    """Return the presentation times (seconds) of the video keyframes."""
+    return [pts for pts, _ in get_keyframes(path)]
+
+
+def find_cut_points(segment_files: List[str], segment_durations: List[float],
+                    pad_durations: List[float], crossfade_duration: float) -> Optional[List[float]]:
+    """
+    Pick, for every segment after the first, the keyframe where its untouched
+    middle starts. Stream copy can only begin on a keyframe, so the transition
+    clip in front of it runs from the crossfade (which also covers the still
+    padding) up to that keyframe.
+    Returns None if some segment has no keyframe before its own tail window.
+    """
+    cut_points = [0.0]
+    last_index = len(segment_files) - 1
+    for i in range(1, len(segment_files)):
+        tail_start = segment_durations[i]
+        if i < last_index:
+            tail_start -= crossfade_duration
+        min_cut = crossfade_duration - pad_durations[i]
+        cut = next((t for t in get_keyframe_times(segment_files[i])
+                    if t > 0 and min_cut <= t < tail_start), None)
+        if cut is None:
+            return None
+        cut_points.append(cut)
+    return cut_points
+
+
+def find_out_points(segment_files: List[str], segment_durations: List[float],
+                    cut_points: List[float],
+                    crossfade_duration: float) -> Optional[List[Tuple[float, float]]]:
+    """
+    Pick, for every segment but the last, the keyframe where its untouched
+    middle ends: the last one at or before the crossfade window and after the
+    segment's own cut point. The concat demuxer stops a file by decoding time,
+    so ending on a keyframe's DTS drops exactly the frames before it even with
+    B-frames; the transition clip re-encodes from that keyframe on.
+    Returns (pts, dts) pairs, or None if some segment has no such keyframe.
+    """
+    out_points = []
+    for i in range(len(segment_files) - 1):
+        tail_start = segment_durations[i] - crossfade_duration
+        candidates = [(pts, dts) for pts, dts in get_keyframes(segment_files[i])
+                      if cut_points[i] < pts <= tail_start]
+        if not candidates:
+            return None
+        out_points.append(candidates[-1])
+    return out_points
+
+
+@contextlib.contextmanager
+def render_clips(jobs: List[Tuple[str, List[str], str]]):
+    """
+    Encode short clips in parallel into a temporary work directory.
+    Each job is (file name, ffmpeg arguments without -threads and output,
+    description). Yields (work_dir, paths) with paths in job order; the
+    directory and everything in it is removed when the block exits.
+    """
+    # Clips are independent of each other; one ffmpeg per clip lets them use all
+    # cores instead of queuing inside a single filter graph. Each gets an even
+    # share of the cores so parallel encoders don't oversubscribe.
+    cpu_count = os.cpu_count() or 1
+    max_workers = max(1, min(len(jobs), cpu_count))
+    threads_per_encode = max(1, cpu_count // max_workers)
+
+    # Intermediates go to the system temp dir (often tmpfs) rather than next to the
+    # output; the directory is removed even when an encode fails and exits
+    with tempfile.TemporaryDirectory(prefix='chain_videos_') as work_dir:
+        paths = [os.path.join(work_dir, name) for name, _, _ in jobs]
+        commands = [
+            (args + ['-threads', str(threads_per_encode), path, '-y'], description)
+            for (_, args, description), path in zip(jobs, paths)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda job: run_command(*job), commands))
+        yield work_dir, paths
+
+
+def combine_with_split_transitions(segment_files: List[str], segment_durations: List[float],
+                                   pad_frames: List[Optional[str]], pad_durations: List[float],
+                                   cut_points: List[float], out_points: List[Tuple[float, float]],
+                                   crossfade_duration: float, output: str, splice_params: dict,
+                                   encode_preset: str = 'veryfast') -> bool:
+    """
+    Re-encode only the crossfade windows and stream-copy everything else.
+    Each transition clip runs from one segment's out keyframe through the blend
+    of its tail into the (still-padded) head of the next, up to that segment's
+    cut keyframe, so both splice points sit on GOP boundaries; the concat
+    demuxer then splices the untouched middles and the transition clips
+    together with -c copy.
+    Transitions are encoded with the segments' own pixel format and audio
+    layout (splice_params) so the copied streams stay consistent.
+    Returns False if the spliced video does not decode cleanly.
+    """
+    transition_jobs = []
+    num_transitions = len(segment_files) - 1
+    sample_rate = int(splice_params['sample_rate'])
+    channel_layout = channel_layout_name(int(splice_params['channels']))
+
+    for i in range(num_transitions):
+        out_pts = out_points[i][0]
+        crossfade_offset = segment_durations[i] - crossfade_duration - out_pts
+        pad = pad_durations[i + 1]
+
+        # The still padding is built in the same graph, so the head of the next
+        # segment is decoded and encoded once
+        inputs = [
+            '-ss', f"{out_pts:.6f}", '-i', segment_files[i],
+            '-t', f"{cut_points[i + 1]:.6f}", '-i', segment_files[i + 1],
+        ]
+        # xfade needs matching time bases; padded heads come out of concat in AVTB
+        filter_parts = ["[0:v]settb=AVTB[tv]"]
+        next_video, next_audio = "[nv]", "[1:a]"
+        if pad > 0:
+            inputs += still_frame_inputs(pad_frames[i + 1], pad, sample_rate, channel_layout)
+            filter_parts += padded_segment_filters(1, 2, "p", splice_params['frame_rate'],
+                                                   splice_params['pix_fmt'], sample_rate,
+                                                   channel_layout)
+            next_video, next_audio = "[pv]", "[pa]"
+        else:
+            filter_parts.append("[1:v]settb=AVTB[nv]")
+
+        filter_parts += [
+            f"[tv]{next_video}xfade=transition=fade:duration={crossfade_duration}"
+            f":offset={crossfade_offset:.6f}[vout]",
+            f"[0:a]{next_audio}acrossfade=d={crossfade_duration}:c1=tri:c2=tri[aout]",
+        ]
+        args = [
+            'ffmpeg', *inputs,
+            '-filter_complex', ";".join(filter_parts), '-map', '[vout]', '-map', '[aout]',
+            '-c:v', 'libx264', '-crf', '18', '-preset', encode_preset, '-tune', 'film',
+            *h264_profile_args(splice_params), '-pix_fmt', splice_params['pix_fmt'],
+            '-c:a', 'aac', '-b:a', '192k', '-ar', str(splice_params['sample_rate']),
+            '-ac', str(splice_params['channels']),
+        ]
+        transition_jobs.append((f"transition_{i + 1}.mp4", args,
+                                f"Rendering transition {i + 1}/{num_transitions}"))
+
+    with render_clips(transition_jobs) as (_, transition_files):
+        concat_lines = []
+        for i, seg in enumerate(segment_files):
+            concat_lines.append(concat_file_line(seg))
+            if cut_points[i] > 0:
+                concat_lines.append(f"inpoint {cut_points[i]:.6f}")
+            if i < num_transitions:
+                # Stop before the out keyframe's packet; the explicit duration keeps the
+                # next file's timestamps aligned to the keyframe's presentation time
+                out_pts, out_dts = out_points[i]
+                concat_lines.append(f"outpoint {out_dts:.6f}")
+                concat_lines.append(f"duration {out_pts - cut_points[i]:.6f}")
+                concat_lines.append(concat_file_line(transition_files[i]))
+
+        return concat_with_stream_copy(concat_lines, output,
+                                       "Splicing segments and transitions (stream copy)")
+
+
+def combine_with_still_clips(segment_files: List[str], pad_frames: List[Optional[str]],
+                             pad_durations: List[float], output: str, splice_params: dict,
+                             encode_preset: str = 'veryfast') -> bool:
+    """
+    Join segments with hard cuts, encoding only the short still-frame clips
+    that pad the start of each segment. The segments themselves are
+    stream-copied; the stills are encoded with the segments' own parameters
+    (splice_params) so the concat demuxer can splice them in.
+    Returns False if the spliced video does not decode cleanly.
+    """
+    sample_rate = int(splice_params['sample_rate'])
+    channel_layout = channel_layout_name(int(splice_params['channels']))
+    still_jobs = []
+    padded = [i for i, pad in enumerate(pad_durations) if pad > 0]
+
+    for i in padded:
+        args = [
+            'ffmpeg', *still_frame_inputs(pad_frames[i], pad_durations[i], sample_rate, channel_layout),
+            '-map', '0:v', '-map', '1:a',
+            '-vf', f"fps={splice_params['frame_rate']},format={splice_params['pix_fmt']},setsar=1",
+            '-c:v', 'libx264', '-crf', '18', '-preset', encode_preset, '-tune', 'film',
+            *h264_profile_args(splice_params),
+            '-c:a', 'aac', '-b:a', '192k', '-ar', str(sample_rate),
+            '-ac', str(splice_params['channels']),
+        ]
+        still_jobs.append((f"still_{i + 1}.mp4", args, f"Rendering start pad for segment {i + 1}"))
+
+    with render_clips(still_jobs) as (_, still_paths):
+        still_files = dict(zip(padded, still_paths))
+        concat_lines = []
+        for i, seg in enumerate(segment_files):
+            if i in still_files:
+                concat_lines.append(concat_file_line(still_files[i]))
+            concat_lines.append(concat_file_line(seg))
+
+        return concat_with_stream_copy(concat_lines, output,
+                                       "Splicing segments and start pads (stream copy)")
+
+
+def crossfade_window_filters(labels: List[str], durations: List[float],
+                             crossfade_duration: float, prefix: str) -> List[str]:
+    """
+    Split each stream into its crossfade-in head, body and crossfade-out tail
+    (the first stream has no head, the last no tail), labelled
+    [{prefix}h{i}], [{prefix}b{i}] and [{prefix}t{i}]. prefix 'a' selects the
+    audio variants of split/trim.
+    """
+    split, trim, setpts = ('asplit', 'atrim', 'asetpts') if prefix == 'a' else ('split', 'trim', 'setpts')
+    last_index = len(labels) - 1
+    filter_parts = []
+    for i, label in enumerate(labels):
+        parts = (['head'] if i > 0 else []) + ['body'] + (['tail'] if i < last_index else [])
+        filter_parts.append(f"{label}{split}={len(parts)}" + "".join(f"[{prefix}{p}{i}]" for p in parts))
+
+        body_start = crossfade_duration if i > 0 else 0
+        body_end = durations[i] - crossfade_duration
+        if i > 0:
+            filter_parts.append(
+                f"[{prefix}head{i}]{trim}=end={crossfade_duration},{setpts}=PTS-STARTPTS[{prefix}h{i}]"
+            )
+        body_trim = f"start={body_start:.3f}" + (f":end={body_end:.3f}" if i < last_index else "")
+        filter_parts.append(f"[{prefix}body{i}]{trim}={body_trim},{setpts}=PTS-STARTPTS[{prefix}b{i}]")
+        if i < last_index:
+            filter_parts.append(
+                f"[{prefix}tail{i}]{trim}=start={body_end:.3f},{setpts}=PTS-STARTPTS[{prefix}t{i}]"
+            )
+    return filter_parts
+
+
+def pairwise_crossfade_filters(video_labels: List[str], audio_labels: List[str],
+                               durations: List[float], crossfade_duration: float) -> List[str]:
+    """
+    Crossfade consecutive streams one boundary at a time, ending in [vout] and
+    [aout]. Every stream is split into head (crossfade in), body and tail
+    (crossfade out), so each dissolve only sees its own two short windows:
+    transitions do not depend on each other and bodies are not pushed through
+    every later crossfade of a chain. Middle streams must be at least twice
+    the crossfade long.
+    """
+    last_index = len(video_labels) - 1
+    video_filter_parts = crossfade_window_filters(video_labels, durations, crossfade_duration, '')
+    audio_filter_parts = crossfade_window_filters(audio_labels, durations, crossfade_duration, 'a')
+
+    video_concat = []
+    audio_concat = []
+    for i in range(last_index):
+        # Video crossfade with simple dissolve (sliding transitions looked jumpy)
+        video_filter_parts.append(
+            f"[t{i}][h{i+1}]xfade=transition=fade:duration={crossfade_duration}:offset=0[x{i}]"
+        )
+        # Audio crossfade: fade each window and mix them; triangular curves match
+        # acrossfade c1=tri:c2=tri. amix halves both inputs while both are active
+        # (normalize=0 needs FFmpeg 4.4+), so the faded tail is padded to outlast
+        # the head and volume=2 restores unity gain
+        audio_filter_parts += [
+            f"[at{i}]afade=t=out:d={crossfade_duration}:curve=tri,apad[afo{i}]",
+            f"[ah{i+1}]afade=t=in:d={crossfade_duration}:curve=tri[afi{i}]",
+            f"[afo{i}][afi{i}]amix=inputs=2:duration=shortest,volume=2[ax{i}]",
+        ]
+        video_concat += [f"[b{i}]", f"[x{i}]"]
+        audio_concat += [f"[ab{i}]", f"[ax{i}]"]
+    video_concat.append(f"[b{last_index}]")
+    audio_concat.append(f"[ab{last_index}]")
+    video_filter_parts.append(f"{''.join(video_concat)}concat=n={len(video_concat)}:v=1:a=0[vout]")
+    audio_filter_parts.append(f"{''.join(audio_concat)}concat=n={len(audio_concat)}:v=0:a=1[aout]")
+    return video_filter_parts + audio_filter_parts
+
+
+def chained_crossfade_filters(video_labels: List[str], audio_labels: List[str],
+                              durations: List[float], crossfade_duration: float) -> List[str]:
+    """
+    Crossfade consecutive streams as one left-deep chain, ending in [vout] and
+    [aout]. Slower than the pairwise graph, but handles crossfades longer than
+    half a segment, where a segment's incoming and outgoing windows overlap.
+    """
+    video_filter_parts = []
+    audio_filter_parts = []
+    last_index = len(video_labels) - 1
+
+    # Calculate cumulative offset for each transition using real durations
+    cumulative_duration = durations[0]
+    for i in range(last_index):
+        v_in_label = video_labels[0] if i == 0 else f"[v{i-1}{i}]"
+        a_in_label = audio_labels[0] if i == 0 else f"[a{i-1}{i}]"
+        v_out_label = f"[v{i}{i+1}]" if i < last_index - 1 else "[vout]"
+        a_out_label = f"[a{i}{i+1}]" if i < last_index - 1 else "[aout]"
+
+        offset = cumulative_duration - crossfade_duration
+        video_filter_parts.append(
+            f"{v_in_label}{video_labels[i+1]}xfade=transition=fade:duration={crossfade_duration}"
+            f":offset={offset:.3f}{v_out_label}"
+        )
+        audio_filter_parts.append(
+            f"{a_in_label}{audio_labels[i+1]}acrossfade=d={crossfade_duration}:c1=tri:c2=tri{a_out_label}"
+        )
+
+        # Update cumulative duration (subtract overlap since streams overlap during crossfade)
+        cumulative_duration = cumulative_duration + durations[i + 1] - crossfade_duration
+    return video_filter_parts + audio_filter_parts
+
+
+def combine_with_xfade_graph(segment_files: List[str], segment_durations: List[float],
+                             pad_frames: List[Optional[str]], pad_durations: List[float],
+                             crossfade_duration: float, output: str,
+                             encode_preset: str = 'veryfast') -> None:
+    """
+    Crossfade all segments through one filter graph, re-encoding the whole video.
+    Still-frame padding is built into the same graph, so every segment is
+    decoded and encoded exactly once.
+    """
+    inputs = []
+    pad_filter_parts = []
+    video_labels = []
+    audio_labels = []
+    input_count = 0
+    for i, seg in enumerate(segment_files):
+        segment_index = input_count
+        inputs += ['-i', seg]
+        input_count += 1
+        if pad_durations[i] > 0:
+            inputs += still_frame_inputs(pad_frames[i], pad_durations[i], 48000, 'stereo')
+            pad_filter_parts += padded_segment_filters(segment_index, input_count, f"p{i}",
+                                                       get_video_frame_rate(seg), 'yuv420p',
+                                                       48000, 'stereo')
+            input_count += 2
+            video_labels.append(f"[p{i}v]")
+            audio_labels.append(f"[p{i}a]")
+        else:
+            # Same time base as the padded streams, which xfade requires
+            pad_filter_parts.append(f"[{segment_index}:v]settb=AVTB[s{i}v]")
+            video_labels.append(f"[s{i}v]")
+            audio_labels.append(f"[{segment_index}:a]")
+
+    if crossfade_duration == 0:
+        # Hard cuts: play the padded segments back to back
+        streams = "".join(v + a for v, a in zip(video_labels, audio_labels))
+        filter_complex = ";".join(
+            pad_filter_parts + [f"{streams}concat=n={len(segment_files)}:v=1:a=1[vout][aout]"]
+        )
+        description = "Combining padded segments"
+    else:
+        # Window lengths and offsets are measured on the padded streams
+        padded_durations = [d + pad for d, pad in zip(segment_durations, pad_durations)]
+        if all(d >= 2 * crossfade_duration for d in padded_durations[1:-1]):
+            crossfade_filter_parts = pairwise_crossfade_filters(video_labels, audio_labels,
+                                                                padded_durations, crossfade_duration)
+        else:
+            # A middle segment's head and tail windows would overlap
+            print("? Crossfade is longer than half a segment; chaining the crossfades instead")
+            crossfade_filter_parts = chained_crossfade_filters(video_labels, audio_labels,
+                                                               padded_durations, crossfade_duration)
+
+        # Combine padding, video and audio filters
+        filter_complex = ";".join(pad_filter_parts + crossfade_filter_parts)
+        description = "Combining segments with smooth transitions"
+
+    # Full ffmpeg command with video and audio
+    ffmpeg_cmd = [
+        'ffmpeg', *inputs, '-filter_complex', filter_complex, '-map', '[vout]', '-map', '[aout]',
+        '-c:v', 'libx264', '-crf', '18', '-preset', encode_preset, '-tune', 'film', '-threads', '0',
+        '-c:a', 'aac', '-b:a', '192k', '-movflags', '+faststart', output, '-y',
+    ]
+    run_command(ffmpeg_cmd, description)
 
 
 def chain_videos(prompt, total_duration, output, segment_duration=12, crossfade_duration=1.0,
-                 pad_seconds=None, size=None):
+                 pad_seconds=None, size=None, encode_preset='veryfast'):
     """Create a longer video by chaining multiple segments."""
 
     num_segments = (total_duration + segment_duration - 1) // segment_duration
@@ -150,53 +776,61 @@ def chain_videos(prompt, total_duration, output, segment_duration=12, crossfade_
 
     segment_files = []
     last_frame = None
-    segment_durations = []
+    duration_futures = []
 
     continuity_hint = (
         "Continue the same shot with the identical characters, outfits, lighting, and camera direction. "
         "Do not reset the scene; keep background layout and motion consistent."
     )
-
-    for i in range(num_segments):
-        segment_num = i + 1
-        segment_file = f"segment_{segment_num}.mp4"
-        frame_file = f"frame_{segment_num}.jpg"
-
-        print(f"\n{'='*60}")
-        print(f"Segment {segment_num}/{num_segments}")
-        print(f"{'='*60}")
-
-        size_flag = f" -r {size}" if size else ""
-
-        # Generate segment
-        if i == 0:
-            # First segment: text-to-video
-            segment_prompt = prompt
-            cmd = f'python video_generator.py "{segment_prompt}" -s {segment_duration}{size_flag} -o {segment_file}'
-        else:
-            # Subsequent segments: image-to-video using last frame
-            segment_prompt = f"{prompt}. {continuity_hint}"
-            cmd = f'python video_generator.py "{segment_prompt}" -s {segment_duration}{size_flag} -o {segment_file} -i {last_frame}'
-
-        run_command(cmd, f"Generating segment {segment_num}")
-
-        # Prepend a short still frame so the next crossfade blends into identical pixels
-        if i > 0 and pad_value > 0:
-            segment_fps = get_video_fps(segment_file)
-            pad_segment_with_frame(segment_file, last_frame, pad_value, segment_fps)
-
-        segment_files.append(segment_file)
-
-        # Extract last frame for next segment (except for the last segment)
-        if i < num_segments - 1:
-            extract_cmd = f'python extract_last_frame.py {segment_file} -o {frame_file}'
-            run_command(extract_cmd, f"Extracting last frame from segment {segment_num}")
-            last_frame = frame_file
-
-        # Track actual duration for accurate crossfade offsets
-        duration = get_video_duration(segment_file)
-        segment_durations.append(duration)
-        print(f"   Segment duration after padding: {duration:.2f}s")
+    continuation_prompt = f"{prompt}. {continuity_hint}"
+
+    # Generator arguments shared by every segment; only prompt/output/image vary
+    generator_options = {'seconds': segment_duration}
+    if size:
+        generator_options['size'] = size
+
+    # One worker pool for the whole chain: probing runs there so only generation
+    # (and the frame it needs) stays on the critical path
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for i in range(num_segments):
+            segment_num = i + 1
+            segment_file = f"segment_{segment_num}.mp4"
+            frame_file = f"frame_{segment_num}.jpg"
+
+            print(f"\n{'='*60}")
+            print(f"Segment {segment_num}/{num_segments}")
+            print(f"{'='*60}")
+
+            # Generate segment
+            print(f"\n?? Generating segment {segment_num}...")
+            if i == 0:
+                # First segment: text-to-video
+                generate_video(prompt, output=segment_file, **generator_options)
+            else:
+                # Subsequent segments: image-to-video using last frame
+                generate_video(continuation_prompt, output=segment_file, input_image=last_frame,
+                               **generator_options)
+            segment_files.append(segment_file)
+
+            # Probe in the background while the next segment generates; only the
+            # combine step needs the durations
+            duration_futures.append(executor.submit(get_video_duration, segment_file))
+
+            # Extract last frame for next segment (except for the last segment). The
+            # next generation needs it, so this stays on the critical path and only
+            # overlaps with the probe above
+            if i < num_segments - 1:
+                print(f"\n?? Extracting last frame from segment {segment_num}...")
+                extract_last_frame(segment_file, frame_file)
+                last_frame = frame_file
+
+        segment_durations = [future.result() for future in duration_futures]
+
+    # Segments stay untouched on disk; the still-frame padding (previous segment's
+    # last frame) is rendered inside the combine step's own filter graph
+    frame_files = [f"frame_{i}.jpg" for i in range(1, num_segments)]
+    pad_frames = [None] + frame_files
+    pad_durations = resolve_pad_durations(segment_files, segment_durations, pad_frames, pad_value)
 
     # Combine all segments
     print(f"\n{'='*60}")
@@ -205,75 +839,62 @@ def chain_videos(prompt, total_duration, output, segment_duration=12, crossfade_
 
     if len(segment_files) == 1:
         # Single segment, just copy
-        import shutil
         shutil.copy(segment_files[0], output)
         print(f"Single segment - copied to {output}")
+    elif crossfade_duration == 0 and not any(pad_durations):
+        # No blending and no re-encoded heads - stream-copy segments back to back
+        concat_lines = [concat_file_line(seg) for seg in segment_files]
+        if not concat_with_stream_copy(concat_lines, output,
+                                       "Concatenating segments (stream copy, no crossfade)"):
+            print("? Stream-copied video does not decode cleanly; re-encoding the full video")
+            combine_with_xfade_graph(segment_files, segment_durations, pad_frames, pad_durations,
+                                     crossfade_duration, output, encode_preset)
     else:
         # Multiple segments - use crossfade for smooth transitions
-        video_filter_parts = []
-        audio_filter_parts = []
-
-        min_duration = min(segment_durations)
+        min_duration = min(d + pad for d, pad in zip(segment_durations, pad_durations))
         if crossfade_duration >= min_duration:
             new_cf = max(0.1, min_duration - 0.1)
             print(f"? Crossfade trimmed from {crossfade_duration}s to {new_cf}s to fit segment length")
             crossfade_duration = new_cf
 
-        # Calculate cumulative offset for each transition using real durations
-        cumulative_duration = segment_durations[0]
-        for i in range(len(segment_files) - 1):
-            # Video filter labels
-            if i == 0:
-                v_in_label = f"[0:v][{i+1}:v]"
-                a_in_label = f"[0:a][{i+1}:a]"
+        cut_points = None
+        splice_params = get_splice_params(segment_files)
+        if splice_params is None:
+            print("? Segments do not share H.264/AAC parameters; re-encoding the full video")
+        elif crossfade_duration > 0:
+            cut_points = find_cut_points(segment_files, segment_durations, pad_durations,
+                                         crossfade_duration)
+            if cut_points is None:
+                print("? No keyframe after the crossfade window; re-encoding the full video")
             else:
-                v_in_label = f"[v{i-1}{i}][{i+1}:v]"
-                a_in_label = f"[a{i-1}{i}][{i+1}:a]"
-
-            v_out_label = f"[v{i}{i+1}]" if i < len(segment_files) - 2 else "[vout]"
-            a_out_label = f"[a{i}{i+1}]" if i < len(segment_files) - 2 else "[aout]"
-
-            offset = cumulative_duration - crossfade_duration
-
-            # Video crossfade with simple dissolve (sliding transitions looked jumpy)
-            video_filter_parts.append(
-                f"{v_in_label}xfade=transition=fade:duration={crossfade_duration}:offset={offset:.3f}{v_out_label}"
-            )
-
-            # Audio crossfade for smooth audio transitions
-            audio_filter_parts.append(
-                f"{a_in_label}acrossfade=d={crossfade_duration}:c1=tri:c2=tri{a_out_label}"
-            )
-
-            # Update cumulative duration (subtract overlap since streams overlap during crossfade)
-            cumulative_duration = cumulative_duration + segment_durations[i + 1] - crossfade_duration
-
-        # Combine video and audio filters
-        filter_complex = ";".join(video_filter_parts + audio_filter_parts)
-
-        # Build input arguments
-        inputs = " ".join([f'-i "{seg}"' for seg in segment_files])
-
-        # Full ffmpeg command with video and audio crossfades
-        ffmpeg_cmd = (
-            f'ffmpeg {inputs} -filter_complex "{filter_complex}" -map "[vout]" -map "[aout]" '
-            f'-c:v libx264 -crf 18 -preset slow -c:a aac -b:a 192k "{output}" -y'
-        )
-        run_command(ffmpeg_cmd, "Combining segments with smooth transitions")
-
-    # Cleanup temporary files
-    print("\n?? Cleaning up temporary files...")
-    for seg in segment_files:
-        if os.path.exists(seg):
-            os.remove(seg)
-            print(f"  Removed {seg}")
-
-    # Clean up frame files
-    for i in range(1, num_segments):
-        frame_file = f"frame_{i}.jpg"
-        if os.path.exists(frame_file):
-            os.remove(frame_file)
-            print(f"  Removed {frame_file}")
+                out_points = find_out_points(segment_files, segment_durations, cut_points,
+                                             crossfade_duration)
+                if out_points is None:
+                    print("? No keyframe before the crossfade window; re-encoding the full video")
+                    cut_points = None
+
+        spliced = False
+        if splice_params is not None and crossfade_duration == 0:
+            # Hard cuts with start padding - only the still pads need encoding
+            spliced = combine_with_still_clips(segment_files, pad_frames, pad_durations, output,
+                                               splice_params, encode_preset)
+            if not spliced:
+                print("? Spliced video does not decode cleanly; re-encoding the full video")
+        elif cut_points is not None:
+            spliced = combine_with_split_transitions(segment_files, segment_durations, pad_frames,
+                                                     pad_durations, cut_points, out_points,
+                                                     crossfade_duration, output, splice_params,
+                                                     encode_preset)
+            if not spliced:
+                print("? Spliced video does not decode cleanly; re-encoding the full video")
+        if not spliced:
+            combine_with_xfade_graph(segment_files, segment_durations, pad_frames, pad_durations,
+                                     crossfade_duration, output, encode_preset)
+
+    # Cleanup temporary files (segments and extracted frames)
+    temp_files = segment_files + frame_files
+    print(f"\n?? Cleaning up {len(temp_files)} temporary files in the background...")
+    remove_files_in_background(temp_files)
 
     print(f"\n? Complete! Long video saved as: {output}")
     print(f"   Total duration: ~{total_duration} seconds")
@@ -317,6 +938,11 @@ Requirements: ffmpeg and extract_last_frame.py must be available.
                              '(default: match crossfade; set to 0 to disable padding)')
     parser.add_argument('--size', type=str, default=None,
                         help='Resolution for all segments (e.g., 1280x720). Defaults to video_generator internal default.')
+    parser.add_argument('--encode-preset', type=str, default='veryfast',
+                        choices=['ultrafast', 'superfast', 'veryfast', 'faster', 'fast',
+                                 'medium', 'slow', 'slower', 'veryslow'],
+                        help='libx264 preset for re-encoded crossfades (default: veryfast; '
+                             'slower presets trade encode time for slightly smaller files)')
 
     args = parser.parse_args()
 
@@ -336,35 +962,15 @@ Requirements: ffmpeg and extract_last_frame.py must be available.
         print("? Error: pad-start must be zero or positive")
         sys.exit(1)
 
-    # Check dependencies
-    try:
-        subprocess.run(['python', 'video_generator.py', '--help'],
-                      capture_output=True, check=True)
-    except Exception:
-        print("? Error: video_generator.py not found or not working")
-        sys.exit(1)
-
-    try:
-        subprocess.run(['python', 'extract_last_frame.py', '--help'],
-                      capture_output=True, check=True)
-    except Exception:
-        print("? Error: extract_last_frame.py not found or not working")
-        sys.exit(1)
-
-    try:
-        subprocess.run(['ffmpeg', '-version'],
-                      capture_output=True, check=True)
-    except Exception:
-        print("? Error: ffmpeg not found")
-        print("   Install ffmpeg: https://ffmpeg.org/download.html")
-        sys.exit(1)
+    check_dependencies()
 
     # Default pad: short ramp-in (60% of crossfade, capped) to avoid long stills
     default_pad = min(args.crossfade * 0.6, 0.6)
     pad_value = args.pad_start if args.pad_start is not None else default_pad
 
     chain_videos(args.prompt, args.duration, args.output,
-                 args.segment_duration, args.crossfade, pad_value, args.size)
+                 args.segment_duration, args.crossfade, pad_value, args.size,
+                 args.encode_preset)
 
 
 if __name__ == '__main__':
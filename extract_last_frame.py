@@ -5,6 +5,9 @@ Useful for daisy-chaining videos by using the last frame as input for the next s
 """
 
 import argparse
+import os
+import shutil
+import subprocess
 import sys
 
 # Set UTF-8 encoding for Windows console
@@ -14,53 +17,111 @@ if sys.platform == "win32":
     except:
         pass
 
-try:
-    import cv2
-except ImportError:
-    print("❌ Error: opencv-python is required for frame extraction")
-    print("Install it with: pip install opencv-python")
-    sys.exit(1)
+def extract_last_frame_with_opencv(video_path, output_path):
+    """
+    Fallback for systems without ffmpeg. OpenCV is only imported here, so the
+    ffmpeg path never pays for loading it.
+    """
+    try:
+        import cv2
+    except ImportError:
+        print("❌ Error: ffmpeg (or opencv-python) is required for frame extraction")
+        print("   Install ffmpeg: https://ffmpeg.org/download.html")
+        sys.exit(1)
 
-def extract_last_frame(video_path, output_path):
-    """Extract the last frame from a video and save it as an image."""
-    
-    # Open the video file
     cap = cv2.VideoCapture(video_path)
-    
+
     if not cap.isOpened():
         print(f"❌ Error: Could not open video file: {video_path}")
         sys.exit(1)
-    
+
     # Get total number of frames
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    
+
     if total_frames == 0:
         print(f"❌ Error: Video has no frames")
         sys.exit(1)
-    
-    print(f"📹 Video has {total_frames} frames")
-    
+
     # Set frame position to the last frame
     cap.set(cv2.CAP_PROP_POS_FRAMES, total_frames - 1)
-    
-    # Read the last frame
     ret, frame = cap.read()
-    
+    cap.release()
+
     if not ret:
         print(f"❌ Error: Could not read the last frame")
         sys.exit(1)
-    
-    # Save the frame
-    success = cv2.imwrite(output_path, frame)
-    
-    if success:
+
+    if cv2.imwrite(output_path, frame):
         print(f"✅ Last frame extracted and saved to: {output_path}")
     else:
         print(f"❌ Error: Could not save frame to: {output_path}")
         sys.exit(1)
-    
-    # Release the video capture object
-    cap.release()
+
+def get_video_stream_duration(video_path):
+    """
+    Return the duration of the video stream itself in seconds, or None.
+    Audio can run past the last picture, so the container duration may not
+    say where the last frame is.
+    """
+    if shutil.which('ffprobe') is None:
+        return None
+    probe = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=duration', '-of', 'csv=p=0', video_path],
+        capture_output=True, text=True
+    )
+    try:
+        return float(probe.stdout.strip())
+    except ValueError:
+        return None
+
+def extract_last_frame(video_path, output_path):
+    """
+    Extract the last frame from a video and save it as an image.
+
+    ffmpeg seeks relative to the end of the file, so only the final GOP is
+    decoded instead of opening and scanning the whole video.
+    """
+    if not os.path.exists(video_path):
+        print(f"❌ Error: Could not open video file: {video_path}")
+        sys.exit(1)
+
+    # Remove any image left by an earlier run so a stale frame can never pass for
+    # this video's last frame (ffmpeg exits cleanly if it decodes no frame)
+    try:
+        os.remove(output_path)
+    except FileNotFoundError:
+        pass
+
+    if shutil.which('ffmpeg') is None:
+        extract_last_frame_with_opencv(video_path, output_path)
+        return
+
+    # Decode only the last 0.1s; -update keeps overwriting the image so the
+    # file ends up holding the very last frame
+    seek_windows = [['-sseof', '-0.1']]
+    # If the audio outlasts the video that window holds no picture; retry from a
+    # second before the end of the video stream itself
+    video_duration = get_video_stream_duration(video_path)
+    if video_duration is not None:
+        seek_windows.append(['-ss', f"{max(0.0, video_duration - 1):.3f}"])
+    else:
+        seek_windows.append(['-sseof', '-1'])
+
+    for seek in seek_windows:
+        result = subprocess.run(
+            ['ffmpeg', '-v', 'error', *seek, '-i', video_path,
+             '-an', '-update', '1', '-q:v', '2', '-y', output_path],
+            capture_output=True, text=True
+        )
+        if result.returncode == 0 and os.path.exists(output_path):
+            print(f"✅ Last frame extracted and saved to: {output_path}")
+            return
+
+    if result.stderr:
+        print(result.stderr)
+    print("⚠️  ffmpeg decoded no frame near the end; trying OpenCV")
+    extract_last_frame_with_opencv(video_path, output_path)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -20,21 +20,128 @@ endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
 deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT")
 api_key = os.getenv("AZURE_OPENAI_API_KEY")
 
-if not all([endpoint, deployment, api_key]):
-    raise ValueError("Missing required environment variables. Please check your .env file.")
-
-# Initialize OpenAI client for Azure (using base OpenAI class with Azure endpoint)
-client = OpenAI(
-    api_key=api_key,
-    base_url=f"{endpoint}openai/v1/",
-    default_headers={"api-key": api_key}  # Azure requires api-key header
-)
-
-# Parse command-line arguments
-parser = argparse.ArgumentParser(
-    description='Generate videos with Azure OpenAI Sora-2',
-    formatter_class=argparse.RawDescriptionHelpFormatter,
-    epilog='''
+# Status polling starts fast and backs off, so a finished job is noticed within
+# seconds without hammering the API during long generations
+POLL_INTERVAL_MIN = 2
+POLL_INTERVAL_MAX = 10
+
+
+# Shared client so every segment and status poll reuses the same pooled keep-alive connections
+_client = None
+
+
+def create_client():
+    """
+    Return the OpenAI client for the configured Azure endpoint, creating it on
+    first use.
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    if not all([endpoint, deployment, api_key]):
+        raise ValueError("Missing required environment variables. Please check your .env file.")
+
+    # Initialize OpenAI client for Azure (using base OpenAI class with Azure endpoint)
+    # The SDK retries 408/409/429/5xx and connection errors with exponential backoff
+    _client = OpenAI(
+        api_key=api_key,
+        base_url=f"{endpoint}openai/v1/",
+        default_headers={"api-key": api_key},  # Azure requires api-key header
+        max_retries=3,
+    )
+    return _client
+
+
+def generate_video(prompt, seconds=12, size='1280x720', output='output.mp4', input_image=None):
+    """
+    Generate a video with Sora-2 and save it to output. Uses image-to-video
+    mode when input_image is given. Exits the process if generation fails.
+    Returns the output path.
+    """
+    try:
+        client = create_client()
+
+        if input_image:
+            # Image-to-video mode
+            print(f"🎬 Generating video with Sora-2 (Image-to-Video mode)...")
+            print(f"Input image: {input_image}")
+            print(f"Prompt: {prompt}")
+            print(f"Duration: {seconds} seconds")
+            print(f"Size: {size}")
+            print(f"Output: {output}\n")
+
+            with open(input_image, "rb") as image_file:
+                video = client.videos.create(
+                    model=deployment,
+                    prompt=prompt,
+                    size=size,
+                    seconds=str(seconds),
+                    input_reference=image_file
+                )
+        else:
+            # Text-to-video mode
+            print(f"🎬 Generating video with Sora-2 (Text-to-Video mode)...")
+            print(f"Prompt: {prompt}")
+            print(f"Duration: {seconds} seconds")
+            print(f"Size: {size}")
+            print(f"Output: {output}\n")
+
+            video = client.videos.create(
+                model=deployment,
+                prompt=prompt,
+                size=size,
+                seconds=str(seconds)
+            )
+
+        print(f"⏳ Job ID: {video.id}")
+        print(f"⏳ Polling status...\n")
+
+        # Poll for completion
+        poll_interval = POLL_INTERVAL_MIN
+        while video.status not in ["completed", "failed", "cancelled"]:
+            print(f"Status: {video.status}")
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, POLL_INTERVAL_MAX)
+            video = client.videos.retrieve(video.id)
+
+        if video.status == "completed":
+            print(f"\n✅ Video generation succeeded!")
+            print(f"⬇️  Downloading video...")
+
+            # Stream the video straight to disk in 1 MB chunks instead of holding it in memory
+            with client.videos.with_streaming_response.download_content(video.id, variant="video") as response:
+                response.stream_to_file(output, chunk_size=1024 * 1024)
+
+            # Get file size
+            file_size = os.path.getsize(output) / (1024 * 1024)  # MB
+            print(f'✅ Video saved as "{output}" ({file_size:.2f} MB)')
+            print(f'🎵 Video includes audio generated by Sora-2')
+        else:
+            print(f"\n❌ Video generation failed with status: {video.status}")
+            if hasattr(video, 'error'):
+                print(f"Error: {video.error}")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        # Try to get more details from the exception
+        if hasattr(e, 'response'):
+            print(f"Response status: {e.response.status_code if hasattr(e.response, 'status_code') else 'N/A'}")
+            print(f"Response body: {e.response.text if hasattr(e.response, 'text') else 'N/A'}")
+        if hasattr(e, 'body'):
+            print(f"Error body: {e.body}")
+        sys.exit(1)
+
+    return output
+
+
+def main():
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(
+        description='Generate videos with Azure OpenAI Sora-2',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
 Examples:
   # Text-to-video
   python video_generator.py "A cat playing with a ball of yarn"
@@ -48,86 +155,21 @@ Examples:
 
 Note: Maximum resolution is 1080p (1920x1080) and maximum duration is 12 seconds.
     '''
-)
-parser.add_argument('prompt', help='Text description of the video to generate')
-parser.add_argument('-s', '--seconds', type=int, default=12, choices=[4, 8, 12],
-                    help='Video duration in seconds (options: 4, 8, or 12; default: 12)')
-parser.add_argument('-r', '--size', type=str, default='1280x720',
-                    help='Video resolution WIDTHxHEIGHT (default: 1280x720)')
-parser.add_argument('-o', '--output', type=str, default='output.mp4',
-                    help='Output filename (default: output.mp4)')
-parser.add_argument('-i', '--input-image', type=str, default=None,
-                    help='Input image file for image-to-video generation (optional)')
-
-args = parser.parse_args()
-
-# Generate video
-try:
-    if args.input_image:
-        # Image-to-video mode
-        print(f"🎬 Generating video with Sora-2 (Image-to-Video mode)...")
-        print(f"Input image: {args.input_image}")
-        print(f"Prompt: {args.prompt}")
-        print(f"Duration: {args.seconds} seconds")
-        print(f"Size: {args.size}")
-        print(f"Output: {args.output}\n")
-        
-        with open(args.input_image, "rb") as image_file:
-            video = client.videos.create(
-                model=deployment,
-                prompt=args.prompt,
-                size=args.size,
-                seconds=str(args.seconds),
-                input_reference=image_file
-            )
-    else:
-        # Text-to-video mode
-        print(f"🎬 Generating video with Sora-2 (Text-to-Video mode)...")
-        print(f"Prompt: {args.prompt}")
-        print(f"Duration: {args.seconds} seconds")
-        print(f"Size: {args.size}")
-        print(f"Output: {args.output}\n")
-        
-        video = client.videos.create(
-            model=deployment,
-            prompt=args.prompt,
-            size=args.size,
-            seconds=str(args.seconds)
-        )
-    
-    print(f"⏳ Job ID: {video.id}")
-    print(f"⏳ Polling status...\n")
-    
-    # Poll for completion
-    while video.status not in ["completed", "failed", "cancelled"]:
-        print(f"Status: {video.status}")
-        time.sleep(10)
-        video = client.videos.retrieve(video.id)
-    
-    if video.status == "completed":
-        print(f"\n✅ Video generation succeeded!")
-        print(f"⬇️  Downloading video...")
-        
-        # Download the video
-        content = client.videos.download_content(video.id, variant="video")
-        content.write_to_file(args.output)
-        
-        # Get file size
-        file_size = os.path.getsize(args.output) / (1024 * 1024)  # MB
-        print(f'✅ Video saved as "{args.output}" ({file_size:.2f} MB)')
-        print(f'🎵 Video includes audio generated by Sora-2')
-    else:
-        print(f"\n❌ Video generation failed with status: {video.status}")
-        if hasattr(video, 'error'):
-            print(f"Error: {video.error}")
-        sys.exit(1)
+    )
+    parser.add_argument('prompt', help='Text description of the video to generate')
+    parser.add_argument('-s', '--seconds', type=int, default=12, choices=[4, 8, 12],
+                        help='Video duration in seconds (options: 4, 8, or 12; default: 12)')
+    parser.add_argument('-r', '--size', type=str, default='1280x720',
+                        help='Video resolution WIDTHxHEIGHT (default: 1280x720)')
+    parser.add_argument('-o', '--output', type=str, default='output.mp4',
+                        help='Output filename (default: output.mp4)')
+    parser.add_argument('-i', '--input-image', type=str, default=None,
+                        help='Input image file for image-to-video generation (optional)')
+
+    args = parser.parse_args()
+
+    generate_video(args.prompt, args.seconds, args.size, args.output, args.input_image)
+
 
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    # Try to get more details from the exception
-    if hasattr(e, 'response'):
-        print(f"Response status: {e.response.status_code if hasattr(e.response, 'status_code') else 'N/A'}")
-        print(f"Response body: {e.response.text if hasattr(e.response, 'text') else 'N/A'}")
-    if hasattr(e, 'body'):
-        print(f"Error body: {e.body}")
-    sys.exit(1)
+if __name__ == '__main__':
+    main()